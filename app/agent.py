@@ -12,17 +12,182 @@ Back-compat:
 
 import os
 import re
-import json
-import datetime
+import time
+import uuid
+import random
+import asyncio
 from typing import Any, Dict, List, Optional
 
-from fastapi import HTTPException
-from openai import OpenAI
-import requests
+from dataclasses import dataclass
+
+import aiohttp
+import httpx
+import msgspec
+import orjson
+from openai import AsyncOpenAI, RateLimitError
 
 from app.schemas import SimulationRequest, SimpleSimulationRequest
 
 
+@dataclass
+class LLMResult:
+    """Result-or-error from the LLM path; main.py maps failures to HTTP at the
+    boundary so the agent core stays framework-free (and skips exception cost
+    on the hot failure paths like 429s)."""
+    ok: bool
+    data: Any = None
+    error: Optional[str] = None
+    status: int = 200
+
+
+# Typed mirror of _SIMULATION_SCHEMA below: msgspec parses and validates the
+# final LLM JSON in one C pass, and the field defaults replace the old
+# setdefault() walk over the parsed dict.
+class TimelineItem(msgspec.Struct):
+    year_or_period: str = ""
+    event: str = ""
+    rationale: str = ""
+
+
+class Scenario(msgspec.Struct):
+    name: str = ""
+    probability: float = 0.0
+    summary: str = ""
+    timeline: List[TimelineItem] = []
+    second_order_effects: List[str] = []
+
+
+class Simulation(msgspec.Struct):
+    premise: str = ""
+    assumptions: List[str] = []
+    time_horizon: str = ""
+    scenarios: List[Scenario] = []
+    tradeoffs: List[str] = []
+    red_team: List[str] = []
+    speculative_realism_score: float = 0.0
+    style: str = ""
+    disclaimer: str = "Speculative scenario generation; not factual prediction."
+
+
+# Shared aiohttp session for tool HTTP calls (Wikipedia). Opened/closed by the
+# FastAPI lifespan in main.py; lazily created if the agent is used standalone.
+# The pooled connector keeps TLS connections to en.wikipedia.org alive so
+# repeated summary fetches skip the ~100-300ms handshake.
+_http_session: Optional[aiohttp.ClientSession] = None
+
+_RETRY_STATUSES = {429, 500, 502, 503, 504}
+
+# Bound on in-flight chat completions so request bursts queue here instead of
+# hammering OpenAI's RPM/TPM limits into a wall of 429s.
+_OPENAI_SEM = asyncio.Semaphore(int(os.getenv("OPENAI_CONCURRENCY", "8")))
+
+# Output shape enforced natively via structured outputs instead of a ~40-line
+# pretty-printed example in the system prompt (fewer tokens per call).
+_TIMELINE_ITEM_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "year_or_period": {"type": "string"},
+        "event": {"type": "string"},
+        "rationale": {"type": "string"},
+    },
+    "required": ["year_or_period", "event", "rationale"],
+    "additionalProperties": False,
+}
+
+_SCENARIO_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "name": {"type": "string"},
+        "probability": {"type": "number"},
+        "summary": {"type": "string"},
+        "timeline": {"type": "array", "items": _TIMELINE_ITEM_SCHEMA},
+        "second_order_effects": {"type": "array", "items": {"type": "string"}},
+    },
+    "required": ["name", "probability", "summary", "timeline", "second_order_effects"],
+    "additionalProperties": False,
+}
+
+_SIMULATION_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "premise": {"type": "string"},
+        "assumptions": {"type": "array", "items": {"type": "string"}},
+        "time_horizon": {"type": "string"},
+        "scenarios": {"type": "array", "items": _SCENARIO_SCHEMA},
+        "tradeoffs": {"type": "array", "items": {"type": "string"}},
+        "red_team": {"type": "array", "items": {"type": "string"}},
+        "speculative_realism_score": {"type": "number"},
+        "style": {"type": "string", "enum": ["brief", "cinematic", "bullet", "paper"]},
+        "disclaimer": {"type": "string"},
+    },
+    "required": [
+        "premise", "assumptions", "time_horizon", "scenarios", "tradeoffs",
+        "red_team", "speculative_realism_score", "style", "disclaimer",
+    ],
+    "additionalProperties": False,
+}
+
+_RESPONSE_FORMAT = {
+    "type": "json_schema",
+    "json_schema": {"name": "simulation", "strict": True, "schema": _SIMULATION_SCHEMA},
+}
+
+# Default anchor intervals by horizon bucket (<=10y, <=25y, else).
+_ANCHOR_TEMPLATES = {10: [1, 3, 5, 10], 25: [1, 5, 10, 25], 50: [1, 5, 10, 25, 50]}
+
+# Precompiled patterns for the hot tool path.
+_HORIZON_RE = re.compile(r"^\s*(\d+)\s*y\s*$")
+_WHATIF_RE = re.compile(r"^what if\s+", re.I)
+_SENT_SPLIT_RE = re.compile(r"(?<=[.!?])\s+")
+
+# Cache of wiki_summary results keyed by (normalized topic, sentences, hour
+# bucket) — popular topics ("printing press") recur across sessions, and the
+# hour bucket gives a cheap TTL. Entries are (ok, summary, source, status).
+_WIKI_CACHE: Dict[tuple, tuple] = {}
+_WIKI_CACHE_MAX = 512
+
+
+def _first_sentences(text: str, n: int) -> str:
+    """Slice text at the nth sentence boundary — O(n) instead of splitting the
+    whole extract and discarding most of it."""
+    count = 0
+    for m in _SENT_SPLIT_RE.finditer(text):
+        count += 1
+        if count >= n:
+            return text[: m.start()]
+    return text
+
+
+def _wiki_cache_put(key: tuple, value: tuple) -> None:
+    if len(_WIKI_CACHE) >= _WIKI_CACHE_MAX:
+        _WIKI_CACHE.pop(next(iter(_WIKI_CACHE)))
+    _WIKI_CACHE[key] = value
+
+
+def _wiki_result(topic: str, ok: bool, summary: str, source: str, status: Optional[int]) -> Dict[str, Any]:
+    res: Dict[str, Any] = {"topic": topic, "ok": ok, "summary": summary, "source": source}
+    if status is not None:
+        res["status"] = status
+    return res
+
+
+async def open_http_session() -> aiohttp.ClientSession:
+    global _http_session
+    if _http_session is None or _http_session.closed:
+        _http_session = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(limit=20, limit_per_host=10, keepalive_timeout=30),
+            headers={"User-Agent": "ChronoScribe/1.2"},
+        )
+    return _http_session
+
+
+async def close_http_session() -> None:
+    global _http_session
+    if _http_session is not None and not _http_session.closed:
+        await _http_session.close()
+    _http_session = None
+
+
 class ChronoScribeAgent:
     """Lightweight agent that plans, calls tools, and returns structured JSON."""
 
@@ -31,113 +196,107 @@ class ChronoScribeAgent:
         model: Optional[str] = None,
         tools_enabled: Optional[bool] = None,
         current_year: Optional[int] = None,
-        client: Optional[OpenAI] = None,
+        client: Optional[AsyncOpenAI] = None,
         name: str = "ChronoScribe Agent",
     ):
         self.name = name
-        self.client = client or OpenAI(api_key=os.getenv("OPENAI_API_KEY"))
+        if client is None:
+            # HTTP/2 multiplexes concurrent chat calls over one TLS connection,
+            # which matters once the semaphore allows several in flight.
+            client = AsyncOpenAI(
+                api_key=os.getenv("OPENAI_API_KEY"),
+                http_client=httpx.AsyncClient(
+                    http2=True,
+                    limits=httpx.Limits(max_connections=100, max_keepalive_connections=20),
+                    timeout=httpx.Timeout(60.0, connect=5.0),
+                ),
+            )
+        self.client = client
         self.model = model or os.getenv("OPENAI_MODEL", "gpt-4o-mini")
         if tools_enabled is None:
             tools_enabled = os.getenv("TOOLS_ENABLED", "1").lower() not in ("0", "false", "no")
         self.tools_enabled = tools_enabled
         if current_year is None:
-            current_year = int(os.getenv("CURRENT_YEAR", datetime.datetime.utcnow().year))
+            current_year = int(os.getenv("CURRENT_YEAR", time.gmtime().tm_year))
         self.current_year = current_year
+        # Both only depend on name/current_year, so build them once instead of
+        # regenerating the ~2KB prompt string and schema list per call.
+        self._system_prompt_str = self._system_prompt_build()
+        self._openai_tools_cached = self._openai_tools_build()
 
     # ---------- Policy / System Prompt ----------
     def _system_prompt(self) -> str:
+        return self._system_prompt_str
+
+    def _system_prompt_build(self) -> str:
         return f"""
 You are {self.name} — a what-if simulation agent.
 Current year is {self.current_year}.
 You may call tools to improve realism: use make_timeline_anchors to set consistent time labels,
-and wiki_summary to ground assumptions. Respond ONLY with a single json object. No prose, no
-code fences, no markdown.
-
-The json MUST match this shape exactly:
-{{
-  "premise": "...",
-  "assumptions": ["..."],
-  "time_horizon": "...",
-  "scenarios": [
-    {{
-      "name": "Baseline",
-      "probability": 0.5,
-      "summary": "...",
-      "timeline": [
-        {{"year_or_period": "T+1y", "event": "...", "rationale": "..."}},
-        {{"year_or_period": "T+5y", "event": "...", "rationale": "..."}}
-      ],
-      "second_order_effects": ["..."]
-    }},
-    {{
-      "name": "Best Case",
-      "probability": 0.25,
-      "summary": "...",
-      "timeline": [],
-      "second_order_effects": []
-    }},
-    {{
-      "name": "Worst Case",
-      "probability": 0.25,
-      "summary": "...",
-      "timeline": [],
-      "second_order_effects": []
-    }}
-  ],
-  "tradeoffs": ["..."],
-  "red_team": ["Key uncertainties or failure modes..."],
-  "speculative_realism_score": 0.0,
-  "style": "brief|cinematic|bullet|paper",
-  "disclaimer": "Short reminder that this is speculative."
-}}
+and wiki_summary to ground assumptions. The response shape is enforced by a json schema;
+fill every field.
 
 Guidelines:
 - Prefer calling tools early to get anchors and a brief background.
+- If you need tools, emit ALL independent tool calls in your FIRST assistant message;
+  do not serialize calls that do not depend on each other's outputs.
+- Provide Baseline, Best Case, and Worst Case scenarios.
+- Label timeline entries with anchors like "T+1y", "T+5y".
 - Keep it concise and information-dense.
 - Ensure scenario probabilities sum to ~1.0.
 - Use realistic causal chains; avoid impossibilities.
-- Output must be valid json and ONLY a json object.
+- red_team lists key uncertainties or failure modes; disclaimer is a short
+  reminder that this is speculative.
 """
 
     # ---------- Tools (environment actions) ----------
     @staticmethod
     def make_timeline_anchors(start_year: int, horizon: str, intervals: Optional[List[int]] = None) -> Dict[str, Any]:
         """Compute T+Ny labels and absolute years from a horizon like '5y', '25y', '50y'."""
-        m = re.match(r"^\s*(\d+)\s*y\s*$", horizon.lower())
+        m = _HORIZON_RE.match(horizon.lower())
         total = int(m.group(1)) if m else 50
         if not intervals:
-            if total <= 10:
-                intervals = [1, 3, 5, 10]
-            elif total <= 25:
-                intervals = [1, 5, 10, 25]
-            else:
-                intervals = [1, 5, 10, 25, 50]
-        anchors = []
-        for n in intervals:
-            if n <= total:
-                anchors.append({"label": f"T+{n}y", "year": start_year + n})
+            intervals = _ANCHOR_TEMPLATES[10 if total <= 10 else 25 if total <= 25 else 50]
+        anchors = [{"label": f"T+{n}y", "year": start_year + n} for n in intervals if n <= total]
         return {"start_year": start_year, "horizon_years": total, "anchors": anchors}
 
     @staticmethod
-    def wiki_summary(topic: str, sentences: int = 3) -> Dict[str, Any]:
+    async def wiki_summary(topic: str, sentences: int = 3) -> Dict[str, Any]:
         """Fetch a short neutral background summary from Wikipedia REST API (best-effort)."""
         try:
             t = topic.strip().strip("?")
-            t = re.sub(r"^what if\s+", "", t, flags=re.I)
+            t = _WHATIF_RE.sub("", t)
             t = t.replace(" ", "_")
             url = f"https://en.wikipedia.org/api/rest_v1/page/summary/{t}"
-            r = requests.get(url, timeout=5)
-            if r.status_code != 200:
-                return {"topic": topic, "ok": False, "summary": "", "source": url, "status": r.status_code}
-            data = r.json()
+
+            key = (t, max(1, sentences), int(time.time() // 3600))
+            cached = _WIKI_CACHE.get(key)
+            if cached is not None:
+                return _wiki_result(topic, *cached)
+
+            session = await open_http_session()
+            data = None
+            for attempt in range(3):
+                async with session.get(url, timeout=aiohttp.ClientTimeout(total=5)) as r:
+                    if r.status in _RETRY_STATUSES and attempt < 2:
+                        await asyncio.sleep(0.1 * (2 ** attempt))
+                        continue
+                    if r.status != 200:
+                        _wiki_cache_put(key, (False, "", url, r.status))
+                        return {"topic": topic, "ok": False, "summary": "", "source": url, "status": r.status}
+                    data = orjson.loads(await r.read())
+                break
             text = data.get("extract", "")
-            parts = re.split(r"(?<=[.!?])\s+", text)
-            short = " ".join(parts[: max(1, sentences)])
+            short = _first_sentences(text, max(1, sentences))
+            _wiki_cache_put(key, (True, short, url, None))
             return {"topic": topic, "ok": True, "summary": short, "source": url}
         except Exception as e:
             return {"topic": topic, "ok": False, "summary": "", "error": str(e)}
 
     def _openai_tools(self) -> List[Dict[str, Any]]:
+        return self._openai_tools_cached
+
+    def _openai_tools_build(self) -> List[Dict[str, Any]]:
         return [
             {
                 "type": "function",
@@ -183,50 +342,86 @@ Guidelines:
         ]
         if req.constraints:
             parts.append("Constraints:\n- " + "\n- ".join(req.constraints))
-        parts.append("Return only a json object as specified above.")
         return "\n".join(parts)
 
     # ---------- Tool execution & model loop ----------
-    def _run_tool_call(self, name: str, arguments_json: str) -> str:
+    async def _run_tool_call(self, name: str, arguments_json: str) -> str:
         try:
-            args = json.loads(arguments_json or "{}")
+            args = orjson.loads(arguments_json or "{}")
         except Exception:
             args = {}
 
         if name == "make_timeline_anchors":
             res = self.make_timeline_anchors(**args)
-            return json.dumps(res)
+            return orjson.dumps(res).decode()
         if name == "wiki_summary":
-            res = self.wiki_summary(**args)
-            return json.dumps(res)
-        return json.dumps({"error": f"Unknown tool {name}"})
+            res = await self.wiki_summary(**args)
+            return orjson.dumps(res).decode()
+        return orjson.dumps({"error": f"Unknown tool {name}"}).decode()
+
+    async def _chat_create(self, **kwargs) -> Any:
+        """Chat completion guarded by the concurrency semaphore, with
+        exponential-backoff retries on rate limits (honoring Retry-After).
+        Returns the SDK response, or an error LLMResult on failure."""
+        for attempt in range(4):
+            try:
+                async with _OPENAI_SEM:
+                    return await self.client.chat.completions.create(**kwargs)
+            except RateLimitError as e:
+                if attempt == 3:
+                    return LLMResult(ok=False, error=f"LLM rate limited: {e}", status=502)
+                retry_after = None
+                resp = getattr(e, "response", None)
+                if resp is not None:
+                    retry_after = resp.headers.get("retry-after")
+                delay = None
+                if retry_after:
+                    try:
+                        # Retry-After may also be an HTTP-date; fall back to
+                        # backoff rather than letting ValueError escape, and cap
+                        # the server-supplied value at the backoff ceiling.
+                        delay = min(float(retry_after), 8.0)
+                    except ValueError:
+                        delay = None
+                if delay is None:
+                    delay = min(8.0, 0.5 * (2 ** attempt)) * (1 + random.random())
+                await asyncio.sleep(delay)
+            except Exception as e:
+                return LLMResult(ok=False, error=f"LLM error: {e}", status=502)
 
-    def _call_openai_json(self, prompt: str, temperature: float) -> Dict[str, Any]:
+    async def _call_openai_json(self, prompt: str, temperature: float) -> LLMResult:
         messages: List[Dict[str, Any]] = [
-            {"role": "system", "content": self._system_prompt()},
+            {"role": "system", "content": self._system_prompt_str},
             {"role": "user", "content": prompt},
         ]
-        tools = self._openai_tools() if self.tools_enabled else None
-
-        # small bounded tool loop
-        for _ in range(4):
-            try:
-                resp = self.client.chat.completions.create(
-                    model=self.model,
-                    response_format={"type": "json_object"},
-                    temperature=temperature,
-                    messages=messages,
-                    tools=tools,
-                    tool_choice="auto" if tools else "none",
-                )
-            except Exception as e:
-                raise HTTPException(status_code=502, detail=f"LLM error: {e}")
+        tools = self._openai_tools_cached if self.tools_enabled else None
+
+        # two rounds: one planning turn (the prompt asks the model to batch all
+        # independent tool calls up front) + one synthesis turn, where
+        # tool_choice="none" forces the final JSON instead of more tool calls
+        for is_final in (False, True):
+            resp = await self._chat_create(
+                model=self.model,
+                response_format=_RESPONSE_FORMAT,
+                temperature=temperature,
+                messages=messages,
+                tools=tools,
+                tool_choice="auto" if tools and not is_final else "none",
+            )
+            if isinstance(resp, LLMResult):
+                return resp
 
             msg = resp.choices[0].message
 
             # If the assistant requested tools, we must append that assistant message
             # (with its tool_calls) BEFORE we append any tool results.
             if getattr(msg, "tool_calls", None):
+                # fire the tool tasks immediately so their I/O runs while we do
+                # the message bookkeeping below
+                tasks = [
+                    asyncio.create_task(self._run_tool_call(tc.function.name, tc.function.arguments))
+                    for tc in msg.tool_calls
+                ]
                 assistant_msg = {
                     "role": "assistant",
                     "content": msg.content or "",
@@ -244,9 +439,12 @@ Guidelines:
                 }
                 messages.append(assistant_msg)
 
-                # Now run each tool and append its result
-                for tc in msg.tool_calls:
-                    tool_out = self._run_tool_call(tc.function.name, tc.function.arguments)
+                # Join the tool tasks and append results in the original order
+                # (the API requires one tool message per call id)
+                results = await asyncio.gather(*tasks, return_exceptions=True)
+                for tc, tool_out in zip(msg.tool_calls, results):
+                    if isinstance(tool_out, BaseException):
+                        tool_out = orjson.dumps({"error": str(tool_out)}).decode()
                     messages.append({
                         "role": "tool",
                         "tool_call_id": tc.id,
@@ -257,33 +455,94 @@ Guidelines:
 
             # No tool calls -> should be final JSON
             try:
-                return json.loads(msg.content or "")
+                return LLMResult(ok=True, data=msgspec.json.decode(msg.content or "", type=Simulation))
             except Exception as e:
-                raise HTTPException(status_code=502, detail=f"LLM JSON parse error: {e}")
+                return LLMResult(ok=False, error=f"LLM JSON parse error: {e}", status=502)
 
-        raise HTTPException(status_code=502, detail="LLM/tool loop did not produce final JSON")
+        return LLMResult(ok=False, error="LLM/tool loop did not produce final JSON", status=502)
 
         # ---------- Public API ----------
-    def simulate(self, req: SimulationRequest) -> Dict[str, Any]:
-            data = self._call_openai_json(self._build_user_prompt(req), temperature=req.temperature)
-
-            # normalization / guards
-            data.setdefault("premise", req.what_if)
-            data.setdefault("time_horizon", req.time_horizon)
-            data.setdefault("style", req.style or "brief")
-            data.setdefault("disclaimer", "Speculative scenario generation; not factual prediction.")
-            for key in ["assumptions", "scenarios", "tradeoffs", "red_team"]:
-                data.setdefault(key, [])
-
-            if isinstance(data.get("scenarios"), list):
-                probs = [s.get("probability", 0) for s in data["scenarios"] if isinstance(s, dict)]
-                total = sum(p for p in probs if isinstance(p, (int, float)))
-                if total and abs(total - 1.0) > 0.05:
-                    data["scenarios"] = [
-                        {**s, "probability": (s.get("probability", 0) / total) if total else 0}
-                        for s in data["scenarios"]
-                    ]
-            return data
+    async def simulate(self, req: SimulationRequest) -> LLMResult:
+            result = await self._call_openai_json(self._build_user_prompt(req), temperature=req.temperature)
+            if not result.ok:
+                return result
+            sim: Simulation = result.data
+
+            # normalization / guards (typed decode already defaulted the list
+            # fields and the disclaimer)
+            if not sim.premise:
+                sim.premise = req.what_if
+            if not sim.time_horizon:
+                sim.time_horizon = req.time_horizon
+            if not sim.style:
+                sim.style = req.style or "brief"
+
+            total = 0.0
+            for s in sim.scenarios:
+                total += s.probability
+            if total and abs(total - 1.0) > 0.05:
+                for s in sim.scenarios:
+                    s.probability = s.probability / total
+
+            # hand plain builtins to the HTTP layer
+            result.data = msgspec.to_builtins(sim)
+            return result
+
+        # ----- Batch path (non-interactive) -----
+    async def simulate_batch(self, reqs: List[SimulationRequest]) -> str:
+        """Submit prompts through the OpenAI Batch API and return the batch id.
+
+        Half the price of the synchronous endpoint at minutes-to-hours latency;
+        meant for bulk generation / cache pre-warming. Tools are skipped — the
+        batch endpoint cannot run our tool loop.
+        """
+        lines = []
+        for req in reqs:
+            body = {
+                "model": self.model,
+                "response_format": _RESPONSE_FORMAT,
+                "temperature": req.temperature,
+                "messages": [
+                    {"role": "system", "content": self._system_prompt_str},
+                    {"role": "user", "content": self._build_user_prompt(req)},
+                ],
+            }
+            lines.append(orjson.dumps({
+                "custom_id": uuid.uuid4().hex,
+                "method": "POST",
+                "url": "/v1/chat/completions",
+                "body": body,
+            }))
+        payload = b"\n".join(lines) + b"\n"
+        f = await self.client.files.create(purpose="batch", file=("chronoscribe_batch.jsonl", payload))
+        batch = await self.client.batches.create(
+            input_file_id=f.id,
+            endpoint="/v1/chat/completions",
+            completion_window="24h",
+        )
+        return batch.id
+
+    async def batch_status(self, batch_id: str) -> Dict[str, Any]:
+        """Poll a batch; once completed, parse results keyed by custom_id."""
+        batch = await self.client.batches.retrieve(batch_id)
+        out: Dict[str, Any] = {"batch_id": batch.id, "status": batch.status}
+        if batch.status == "completed" and batch.output_file_id:
+            content = await self.client.files.content(batch.output_file_id)
+            results: Dict[str, Any] = {}
+            for line in content.text.splitlines():
+                if not line.strip():
+                    continue
+                entry = orjson.loads(line)
+                resp = (entry.get("response") or {}).get("body") or {}
+                try:
+                    msg = resp["choices"][0]["message"]["content"]
+                    results[entry["custom_id"]] = msgspec.to_builtins(
+                        msgspec.json.decode(msg, type=Simulation)
+                    )
+                except Exception as e:
+                    results[entry.get("custom_id", "?")] = {"error": str(e)}
+            out["results"] = results
+        return out
 
         # ----- Simple input path -----
     _HORIZON = {"short": "5y", "medium": "25y", "long": "50y"}
@@ -302,9 +561,11 @@ Guidelines:
                 return {"style": "brief", "temperature": 0.6}
             return {"style": "brief", "temperature": 0.7}
 
-    def simulate_simple(self, s: SimpleSimulationRequest) -> Dict[str, Any]:
+    async def simulate_simple(self, s: SimpleSimulationRequest) -> LLMResult:
             cfg = self._preset_config(s.preset)
-            req = SimulationRequest(
+            # every field comes from the already-validated simple request or
+            # hardcoded presets, so skip Pydantic validation on construction
+            req = SimulationRequest.model_construct(
                 what_if=s.what_if,
                 time_horizon=self._HORIZON[s.horizon],
                 scope=s.focus,
@@ -312,15 +573,27 @@ Guidelines:
                 constraints=cfg.get("constraints"),
                 temperature=cfg["temperature"],
             )
-            return self.simulate(req)
+            return await self.simulate(req)
 
 
 agent = ChronoScribeAgent()
 
-def generate_simulation(req: SimulationRequest) -> Dict[str, Any]:
+async def generate_simulation(req: SimulationRequest) -> LLMResult:
     """Backward-compatible wrapper for existing main.py code."""
-    return agent.simulate(req)
+    return await agent.simulate(req)
 
-def generate_simulation_simple(s: SimpleSimulationRequest) -> Dict[str, Any]:
+async def generate_simulation_simple(s: SimpleSimulationRequest) -> LLMResult:
     """Backward-compatible wrapper for existing main.py code."""
-    return agent.simulate_simple(s)
+    return await agent.simulate_simple(s)
+
+async def submit_simulation_batch(reqs: List[SimulationRequest]) -> str:
+    """Wrapper over the singleton for main.py."""
+    return await agent.simulate_batch(reqs)
+
+async def get_simulation_batch(batch_id: str) -> Dict[str, Any]:
+    """Wrapper over the singleton for main.py."""
+    return await agent.batch_status(batch_id)
+
+async def close_openai_client() -> None:
+    """Close the singleton agent's OpenAI HTTP client (FastAPI shutdown)."""
+    await agent.client.close()
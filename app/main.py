@@ -1,18 +1,35 @@
-from typing import Any, Dict, Union
+from contextlib import asynccontextmanager
+from typing import List, Union
 from fastapi import FastAPI, HTTPException
 from fastapi.params import Body
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse
 from app.schemas import SimulationRequest, SimpleSimulationRequest, HealthResponse
-from app.agent import generate_simulation, generate_simulation_simple
+from app.agent import (
+    generate_simulation,
+    generate_simulation_simple,
+    submit_simulation_batch,
+    get_simulation_batch,
+    open_http_session,
+    close_http_session,
+    close_openai_client,
+)
 from fastapi.responses import FileResponse
 from pathlib import Path
 
 RequestBody = Union[SimpleSimulationRequest, SimulationRequest]
 
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    await open_http_session()
+    yield
+    await close_http_session()
+    await close_openai_client()
+
 app = FastAPI(
     title="ChronoScribe Agent",
     description="What-if simulator: explores alternate timelines with branching scenarios.",
     version="1.2.0",
+    lifespan=lifespan,
 )
 
 @app.get("/health", response_model=HealthResponse, tags=["system"])
@@ -23,8 +40,10 @@ def health():
 def ui():
     return FileResponse(Path(__file__).parent / "static" / "index.html")
 
-@app.post("/simulate", response_model=Dict[str, Any], tags=["simulate"])
-def simulate(
+# No response_model: the agent already returns a normalized dict, and declaring
+# Dict[str, Any] only adds a jsonable_encoder + validation pass per request.
+@app.post("/simulate", tags=["simulate"])
+async def simulate(
     body: RequestBody = Body(
         ...,
         examples={
@@ -57,10 +76,33 @@ def simulate(
 ):
     try:
         if isinstance(body, SimpleSimulationRequest):
-            result = generate_simulation_simple(body)
+            result = await generate_simulation_simple(body)
         else:
-            result = generate_simulation(body)
-        return JSONResponse(content=result)
+            result = await generate_simulation(body)
+        if not result.ok:
+            raise HTTPException(status_code=result.status, detail=result.error)
+        return ORJSONResponse(content=result.data)
+    except HTTPException as e:
+        raise e
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+@app.post("/simulate/batch", tags=["simulate"])
+async def simulate_batch(batch: List[SimulationRequest]):
+    """Submit a non-interactive batch of simulations (OpenAI Batch API, 24h window)."""
+    try:
+        batch_id = await submit_simulation_batch(batch)
+        return ORJSONResponse(content={"batch_id": batch_id, "status": "submitted"})
+    except HTTPException as e:
+        raise e
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+@app.get("/simulate/batch/{batch_id}", tags=["simulate"])
+async def simulate_batch_status(batch_id: str):
+    """Poll a submitted batch; results appear keyed by custom_id once completed."""
+    try:
+        return ORJSONResponse(content=await get_simulation_batch(batch_id))
     except HTTPException as e:
         raise e
     except Exception as e:
@@ -1,7 +1,9 @@
 from typing import List, Optional, Literal
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 class SimulationRequest(BaseModel):
+    model_config = ConfigDict(extra="ignore")
+
     what_if: str = Field(..., example="What if the printing press was never invented?")
     time_horizon: str = Field(default="50y")
     scope: str = Field(default="mixed")
@@ -14,6 +16,8 @@ class HealthResponse(BaseModel):
 
 # 👇 New: super-simple input
 class SimpleSimulationRequest(BaseModel):
+    model_config = ConfigDict(extra="ignore")
+
     what_if: str = Field(..., example="What if the printing press was never invented?")
     # few friendly knobs (optional)
     preset: Literal["default","cinematic","academic","risk","optimistic","pessimistic"] = "default"
@@ -0,0 +1,49 @@
+import asyncio
+import os
+
+os.environ.setdefault("OPENAI_API_KEY", "test")
+
+from app.agent import ChronoScribeAgent
+from app.schemas import SimpleSimulationRequest
+
+
+def _captured_request(agent, simple):
+    """Run simulate_simple with simulate stubbed out; return the SimulationRequest it built."""
+    captured = {}
+
+    async def fake_simulate(req):
+        captured["req"] = req
+        return {}
+
+    agent.simulate = fake_simulate
+    asyncio.run(agent.simulate_simple(simple))
+    return captured["req"]
+
+
+# simulate_simple builds its SimulationRequest with model_construct, which
+# skips validation and would silently drop a misspelled kwarg — these tests
+# pin every constructed field value.
+
+def test_simulate_simple_constructs_expected_request():
+    agent = ChronoScribeAgent(current_year=2026)
+    req = _captured_request(
+        agent,
+        SimpleSimulationRequest(what_if="What if x?", preset="risk", horizon="short", focus="tech"),
+    )
+    assert req.what_if == "What if x?"
+    assert req.time_horizon == "5y"
+    assert req.scope == "tech"
+    assert req.style == "bullet"
+    assert req.constraints == ["call out major risks explicitly"]
+    assert req.temperature == 0.6
+
+
+def test_simulate_simple_defaults():
+    agent = ChronoScribeAgent(current_year=2026)
+    req = _captured_request(agent, SimpleSimulationRequest(what_if="What if y?"))
+    assert req.what_if == "What if y?"
+    assert req.time_horizon == "50y"
+    assert req.scope == "mixed"
+    assert req.style == "brief"
+    assert req.constraints is None
+    assert req.temperature == 0.7